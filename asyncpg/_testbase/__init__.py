@@ -436,18 +436,51 @@ def with_connection_options(**options):
 
 class ConnectedTestCase(ClusterTestCase):
 
+    # If True, tests run on a connection acquired from a pool shared
+    # by all tests in the class instead of a new connection opened for
+    # every test.  The connection is reset when released back to the
+    # pool.  Tests that set connection options with
+    # `with_connection_options` always get a dedicated connection.
+    SHARED_POOL = False
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._shared_pool = None
+        if cls.SHARED_POOL:
+            cls._shared_pool = cls.loop.run_until_complete(
+                create_pool(loop=cls.loop, min_size=1, max_size=1,
+                            **cls.get_connection_spec()))
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            if cls._shared_pool is not None:
+                cls.loop.run_until_complete(cls._shared_pool.close())
+                cls._shared_pool = None
+        finally:
+            super().tearDownClass()
+
     def setUp(self):
         super().setUp()
 
         # Extract options set up with `with_connection_options`.
         test_func = getattr(self, self._testMethodName).__func__
         opts = getattr(test_func, '__connect_options__', {})
-        self.con = self.loop.run_until_complete(self.connect(**opts))
+        if self._shared_pool is not None and not opts:
+            self.con = self.loop.run_until_complete(
+                self._shared_pool.acquire())
+        else:
+            self.con = self.loop.run_until_complete(self.connect(**opts))
         self.server_version = self.con.get_server_version()
 
     def tearDown(self):
         try:
-            self.loop.run_until_complete(self.con.close())
+            if isinstance(self.con, pg_pool.PoolConnectionProxy):
+                self.loop.run_until_complete(
+                    self._shared_pool.release(self.con))
+            else:
+                self.loop.run_until_complete(self.con.close())
             self.con = None
         finally:
             super().tearDown()
@@ -626,6 +626,17 @@ class Connection(metaclass=ConnectionMeta):
         :return:
             A :class:`~prepared_stmt.PreparedStatement` instance.
 
+        .. note::
+            Every call to this method prepares a new statement on the
+            server.  Query methods such as :meth:`fetch` and
+            :meth:`execute` reuse server-side statements from the
+            connection's statement cache (see *statement_cache_size*
+            in :func:`~asyncpg.connection.connect`), so there is no need
+            to call :meth:`prepare` merely to avoid re-parsing a
+            frequently used query.  To run the same query many times
+            via a prepared statement, prepare it once and keep the
+            returned object.
+
         .. versionchanged:: 0.22.0
             Added the *record_class* parameter.
 
@@ -2297,7 +2308,9 @@ async def connect(dsn=None, *,
     :param type record_class:
         If specified, the class to use for records returned by queries on
         this connection object.  Must be a subclass of
-        :class:`~asyncpg.Record`.
+        :class:`~asyncpg.Record`.  Subclasses should declare
+        ``__slots__ = ()``, otherwise every record carries an
+        additional (mostly unused) ``__dict__`` slot.
 
     :param SessionAttribute target_session_attrs:
         If specified, check that the host has the correct attribute.
@@ -220,7 +220,7 @@ cdef class PreparedStatementState:
     cdef _ensure_rows_decoder(self):
         cdef:
             list cols_names
-            object cols_mapping
+            dict cols_mapping
             tuple row
             uint32_t oid
             Codec codec
@@ -233,7 +233,7 @@ cdef class PreparedStatementState:
             self.cols_desc = record.ApgRecordDesc_New({}, ())
             return
 
-        cols_mapping = collections.OrderedDict()
+        cols_mapping = {}
         cols_names = []
         codecs = []
         for i from 0 <= i < self.cols_num:
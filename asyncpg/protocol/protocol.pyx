@@ -1041,19 +1041,19 @@ class Protocol(BaseProtocol, asyncio.Protocol):
     pass
 
 
-def _create_record(object mapping, tuple elems):
-    # Exposed only for testing purposes.
+cdef _new_record_desc(object mapping):
+    if mapping is None:
+        return record.ApgRecordDesc_New({}, ())
+    else:
+        return record.ApgRecordDesc_New(
+            mapping, tuple(mapping) if mapping else ())
 
+
+cdef _new_record(object desc, tuple elems):
     cdef:
         object rec
         int32_t i
 
-    if mapping is None:
-        desc = record.ApgRecordDesc_New({}, ())
-    else:
-        desc = record.ApgRecordDesc_New(
-            mapping, tuple(mapping) if mapping else ())
-
     rec = record.ApgRecord_New(Record, desc, len(elems))
     for i in range(len(elems)):
         elem = elems[i]
@@ -1062,4 +1062,22 @@ def _create_record(object mapping, tuple elems):
     return rec
 
 
+def _create_record(object mapping, tuple elems):
+    # Exposed only for testing purposes.
+    return _new_record(_new_record_desc(mapping), elems)
+
+
+def _create_records(object mapping, tuple elems, int n):
+    # Exposed only for testing purposes: creates and immediately
+    # discards n records to exercise the Record free list without
+    # the overhead of a Python-level loop.
+    cdef:
+        object desc
+        int i
+
+    desc = _new_record_desc(mapping)
+    for i in range(n):
+        _new_record(desc, elems)
+
+
 Record = <object>record.ApgRecord_InitTypes()
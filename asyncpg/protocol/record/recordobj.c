@@ -62,7 +62,13 @@ ApgRecord_New(PyTypeObject *type, PyObject *desc, Py_ssize_t size)
         if ((size_t)size > MAX_RECORD_SIZE) {
             return PyErr_NoMemory();
         }
+        /* Allocate subclass instances directly instead of calling the
+         * type: this bypasses the generic tp_new machinery entirely.
+         */
         o = (ApgRecordObject *)type->tp_alloc(type, size);
+        if (o == NULL) {
+            return NULL;
+        }
         if (!_ApgObject_GC_IS_TRACKED((PyObject *)o)) {
             PyErr_SetString(
                 PyExc_TypeError,
@@ -163,8 +169,15 @@ static Py_hash_t
 record_hash(ApgRecordObject *v)
 {
     Py_uhash_t acc = _PyHASH_XXPRIME_5;
-    size_t i, len = (size_t)Py_SIZE(v);
-    PyObject **els = v->ob_item;
+    size_t i, len;
+    PyObject **els;
+
+    if (v->self_hash != -1) {
+        return v->self_hash;
+    }
+
+    len = (size_t)Py_SIZE(v);
+    els = v->ob_item;
     for (i = 0; i < len; i++) {
         Py_uhash_t lane = (Py_uhash_t)PyObject_Hash(els[i]);
         if (lane == (Py_uhash_t)-1) {
@@ -179,8 +192,9 @@ record_hash(ApgRecordObject *v)
     acc += len ^ (_PyHASH_XXPRIME_5 ^ 3527539UL);
 
     if (acc == (Py_uhash_t)-1) {
-        return 1546275796;
+        acc = 1546275796;
     }
+    v->self_hash = (Py_hash_t)acc;
     return (Py_hash_t)acc;
 }
 
@@ -224,6 +238,31 @@ record_hash(ApgRecordObject *v)
 #endif
 
 
+/* Equality check for a pair of record items.  Shortcuts identical
+ * objects and machine-sized exact ints (the most common column values)
+ * before falling back to the generic rich comparison.
+ */
+static inline int
+record_item_eq(PyObject *v, PyObject *w)
+{
+    if (v == w) {
+        return 1;
+    }
+
+    if (PyLong_CheckExact(v) && PyLong_CheckExact(w)) {
+        int v_overflow, w_overflow;
+        long long vv = PyLong_AsLongLongAndOverflow(v, &v_overflow);
+        long long ww = PyLong_AsLongLongAndOverflow(w, &w_overflow);
+
+        if (!v_overflow && !w_overflow) {
+            return vv == ww;
+        }
+    }
+
+    return PyObject_RichCompareBool(v, w, Py_EQ);
+}
+
+
 static PyObject *
 record_richcompare(PyObject *v, PyObject *w, int op)
 {
@@ -283,7 +322,7 @@ record_richcompare(PyObject *v, PyObject *w, int op)
      * vlen and wlen across the comparison calls.
      */
     for (i = 0; i < vlen && i < wlen; i++) {
-        comp = PyObject_RichCompareBool(V_ITEM(i), W_ITEM(i), Py_EQ);
+        comp = record_item_eq(V_ITEM(i), W_ITEM(i));
         if (comp < 0) {
             return NULL;
         }
@@ -331,7 +370,10 @@ record_richcompare(PyObject *v, PyObject *w, int op)
 static PyObject *
 record_item(ApgRecordObject *o, Py_ssize_t i)
 {
-    if (i < 0 || i >= Py_SIZE(o)) {
+    /* A single unsigned comparison covers both i < 0 and i >= size,
+     * see valid_index() in CPython/Objects/tupleobject.c.
+     */
+    if ((size_t)i >= (size_t)Py_SIZE(o)) {
         PyErr_SetString(PyExc_IndexError, "record index out of range");
         return NULL;
     }
@@ -353,13 +395,26 @@ typedef enum item_by_name_result {
 static item_by_name_result_t
 record_item_by_name(ApgRecordObject *o, PyObject *item, PyObject **result)
 {
+    PyObject *mapping = o->desc->mapping;
     PyObject *mapped;
     PyObject *val;
     Py_ssize_t i;
 
-    mapped = PyObject_GetItem(o->desc->mapping, item);
-    if (mapped == NULL) {
-        goto noitem;
+    if (PyDict_CheckExact(mapping)) {
+        /* Fast path for the descriptors built by prepared statements:
+         * str keys cache their hash, so this is a single table probe.
+         */
+        mapped = PyDict_GetItemWithError(mapping, item);
+        if (mapped == NULL) {
+            goto noitem;
+        }
+        Py_INCREF(mapped);
+    }
+    else {
+        mapped = PyObject_GetItem(mapping, item);
+        if (mapped == NULL) {
+            goto noitem;
+        }
     }
 
     if (!PyIndex_Check(mapped)) {
@@ -470,7 +525,7 @@ static PyObject *
 record_repr(ApgRecordObject *v)
 {
     Py_ssize_t i, n;
-    PyObject *keys_iter, *type_prefix;
+    PyObject *keys, *type_prefix;
     _PyUnicodeWriter writer;
 
     n = Py_SIZE(v);
@@ -478,14 +533,11 @@ record_repr(ApgRecordObject *v)
         return PyUnicode_FromFormat("<%s>", get_typename(Py_TYPE(v)));
     }
 
-    keys_iter = PyObject_GetIter(v->desc->keys);
-    if (keys_iter == NULL) {
-        return NULL;
-    }
+    keys = v->desc->keys;
+    assert(PyTuple_CheckExact(keys));
 
     i = Py_ReprEnter((PyObject *)v);
     if (i != 0) {
-        Py_DECREF(keys_iter);
         if (i > 0) {
             return PyUnicode_FromFormat("<%s ...>", get_typename(Py_TYPE(v)));
         }
@@ -497,6 +549,9 @@ record_repr(ApgRecordObject *v)
     writer.min_length = 12; /* <Record a=1> */
 
     type_prefix = PyUnicode_FromFormat("<%s ", get_typename(Py_TYPE(v)));
+    if (type_prefix == NULL) {
+        goto error;
+    }
     if (_PyUnicodeWriter_WriteStr(&writer, type_prefix) < 0) {
         Py_DECREF(type_prefix);
         goto error;
@@ -505,7 +560,6 @@ record_repr(ApgRecordObject *v)
 
     for (i = 0; i < n; ++i) {
         PyObject *key;
-        PyObject *key_repr;
         PyObject *val_repr;
 
         if (i > 0) {
@@ -523,26 +577,33 @@ record_repr(ApgRecordObject *v)
             goto error;
         }
 
-        key = PyIter_Next(keys_iter);
-        if (key == NULL) {
+        if (i >= PyTuple_GET_SIZE(keys)) {
             Py_DECREF(val_repr);
             PyErr_SetString(PyExc_RuntimeError, "invalid record mapping");
             goto error;
         }
 
-        key_repr = PyObject_Str(key);
-        Py_DECREF(key);
-        if (key_repr == NULL) {
-            Py_DECREF(val_repr);
-            goto error;
+        /* Column names are always str and can be written as is;
+         * only call str() on keys of other types.
+         */
+        key = PyTuple_GET_ITEM(keys, i);
+        if (PyUnicode_CheckExact(key)) {
+            Py_INCREF(key);
+        }
+        else {
+            key = PyObject_Str(key);
+            if (key == NULL) {
+                Py_DECREF(val_repr);
+                goto error;
+            }
         }
 
-        if (_PyUnicodeWriter_WriteStr(&writer, key_repr) < 0) {
-            Py_DECREF(key_repr);
+        if (_PyUnicodeWriter_WriteStr(&writer, key) < 0) {
+            Py_DECREF(key);
             Py_DECREF(val_repr);
             goto error;
         }
-        Py_DECREF(key_repr);
+        Py_DECREF(key);
 
         if (_PyUnicodeWriter_WriteChar(&writer, '=') < 0) {
             Py_DECREF(val_repr);
@@ -561,12 +622,10 @@ record_repr(ApgRecordObject *v)
         goto error;
     }
 
-    Py_DECREF(keys_iter);
     Py_ReprLeave((PyObject *)v);
     return _PyUnicodeWriter_Finish(&writer);
 
 error:
-    Py_DECREF(keys_iter);
     _PyUnicodeWriter_Dealloc(&writer);
     Py_ReprLeave((PyObject *)v);
     return NULL;
@@ -801,7 +860,6 @@ record_iter(PyObject *seq)
 typedef struct {
     PyObject_HEAD
     Py_ssize_t it_index;
-    PyObject *it_key_iter;
     ApgRecordObject *it_seq; /* Set to NULL when iterator is exhausted */
 } ApgRecordItemsObject;
 
@@ -810,7 +868,6 @@ static void
 record_items_dealloc(ApgRecordItemsObject *it)
 {
     PyObject_GC_UnTrack(it);
-    Py_CLEAR(it->it_key_iter);
     Py_CLEAR(it->it_seq);
     PyObject_GC_Del(it);
 }
@@ -819,7 +876,6 @@ record_items_dealloc(ApgRecordItemsObject *it)
 static int
 record_items_traverse(ApgRecordItemsObject *it, visitproc visit, void *arg)
 {
-    Py_VISIT(it->it_key_iter);
     Py_VISIT(it->it_seq);
     return 0;
 }
@@ -829,6 +885,7 @@ static PyObject *
 record_items_next(ApgRecordItemsObject *it)
 {
     ApgRecordObject *seq;
+    PyObject *keys;
     PyObject *key;
     PyObject *val;
     PyObject *tup;
@@ -839,38 +896,36 @@ record_items_next(ApgRecordItemsObject *it)
         return NULL;
     }
     assert(ApgRecord_Check(seq));
-    assert(it->it_key_iter != NULL);
 
-    key = PyIter_Next(it->it_key_iter);
-    if (key == NULL) {
-        /* likely it_key_iter had less items than seq has values */
-        goto exhausted;
-    }
+    /* Keys are always a tuple (see ApgRecordDesc_New), so index it
+     * directly alongside the values instead of driving a separate
+     * key iterator.  Invalid records with a mismatched number of keys
+     * and values stop at the shorter of the two.
+     */
+    keys = seq->desc->keys;
+    assert(PyTuple_CheckExact(keys));
 
-    if (it->it_index < Py_SIZE(seq)) {
-        val = ApgRecord_GET_ITEM(seq, it->it_index);
-        ++it->it_index;
-        Py_INCREF(val);
-    }
-    else {
-        /* it_key_iter had more items than seq has values */
-        Py_DECREF(key);
+    if (it->it_index >= Py_SIZE(seq) ||
+            it->it_index >= PyTuple_GET_SIZE(keys)) {
         goto exhausted;
     }
 
     tup = PyTuple_New(2);
     if (tup == NULL) {
-        Py_DECREF(val);
-        Py_DECREF(key);
         goto exhausted;
     }
 
+    key = PyTuple_GET_ITEM(keys, it->it_index);
+    val = ApgRecord_GET_ITEM(seq, it->it_index);
+    ++it->it_index;
+
+    Py_INCREF(key);
     PyTuple_SET_ITEM(tup, 0, key);
+    Py_INCREF(val);
     PyTuple_SET_ITEM(tup, 1, val);
     return tup;
 
 exhausted:
-    Py_CLEAR(it->it_key_iter);
     Py_CLEAR(it->it_seq);
     return NULL;
 }
@@ -916,23 +971,16 @@ static PyObject *
 record_new_items_iter(PyObject *seq)
 {
     ApgRecordItemsObject *it;
-    PyObject *key_iter;
 
     if (!ApgRecord_Check(seq)) {
         PyErr_BadInternalCall();
         return NULL;
     }
 
-    key_iter = PyObject_GetIter(((ApgRecordObject*)seq)->desc->keys);
-    if (key_iter == NULL) {
-        return NULL;
-    }
-
     it = PyObject_GC_New(ApgRecordItemsObject, &ApgRecordItems_Type);
     if (it == NULL)
         return NULL;
 
-    it->it_key_iter = key_iter;
     it->it_index = 0;
     Py_INCREF(seq);
     it->it_seq = (ApgRecordObject *)seq;
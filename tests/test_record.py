@@ -14,30 +14,37 @@ import sys
 import asyncpg
 from asyncpg import _testbase as tb
 from asyncpg.protocol.protocol import _create_record as Record
+from asyncpg.protocol.protocol import _create_records
 
 
-R_A = collections.OrderedDict([('a', 0)])
-R_AB = collections.OrderedDict([('a', 0), ('b', 1)])
-R_AC = collections.OrderedDict([('a', 0), ('c', 1)])
-R_ABC = collections.OrderedDict([('a', 0), ('b', 1), ('c', 2)])
+R_A = {'a': 0}
+R_AB = {'a': 0, 'b': 1}
+R_AC = {'a': 0, 'c': 1}
+R_ABC = {'a': 0, 'b': 1, 'c': 2}
 
 
 class CustomRecord(asyncpg.Record):
-    pass
+    __slots__ = ()
 
 
 class AnotherCustomRecord(asyncpg.Record):
-    pass
+    __slots__ = ()
 
 
 class TestRecord(tb.ConnectedTestCase):
 
+    SHARED_POOL = True
+
     @contextlib.contextmanager
     def checkref(self, *objs):
         cnt = [sys.getrefcount(objs[i]) for i in range(len(objs))]
         yield
-        for _ in range(3):
-            gc.collect()
+        # Records are freed by refcounting as soon as they go out of
+        # scope, so only pay for full collections if something appears
+        # to be kept alive by a reference cycle.
+        if any(sys.getrefcount(objs[i]) != cnt[i] for i in range(len(objs))):
+            for _ in range(3):
+                gc.collect()
         for i in range(len(objs)):
             before = cnt[i]
             after = sys.getrefcount(objs[i])
@@ -71,9 +78,9 @@ class TestRecord(tb.ConnectedTestCase):
             del r
 
     def test_record_freelist_ok(self):
-        for _ in range(10000):
-            Record(R_A, (42,))
-            Record(R_AB, (42, 42,))
+        _create_records(R_A, (42,), 10000)
+        _create_records(R_AB, (42, 42,), 10000)
+        self.assertEqual(Record(R_AB, (42, 42,)), (42, 42))
 
     def test_record_len_getindex(self):
         r = Record(R_A, (42,))
@@ -88,16 +95,29 @@ class TestRecord(tb.ConnectedTestCase):
         self.assertEqual(r['a'], 42)
         self.assertEqual(r['b'], 43)
 
+        self.assertEqual(r[-1], 43)
+        self.assertEqual(r[-2], 42)
+
         with self.assertRaisesRegex(IndexError,
                                     'record index out of range'):
             r[1000]
 
+        with self.assertRaisesRegex(IndexError,
+                                    'record index out of range'):
+            r[-1000]
+
         with self.assertRaisesRegex(KeyError, 'spam'):
             r['spam']
 
         with self.assertRaisesRegex(KeyError, 'spam'):
             Record(None, (1,))['spam']
 
+        r = Record(collections.OrderedDict([('a', 0), ('b', 1)]), (42, 43))
+        self.assertEqual(r['a'], 42)
+        self.assertEqual(r['b'], 43)
+        with self.assertRaises(KeyError):
+            r[['a']]
+
         with self.assertRaisesRegex(RuntimeError, 'invalid record descriptor'):
             Record({'spam': 123}, (1,))['spam']
 
@@ -217,6 +237,30 @@ class TestRecord(tb.ConnectedTestCase):
         self.assertNotIn(r3, d)
         self.assertIn(r4, d)
 
+    def test_record_hash_cached(self):
+        class Elem:
+            hash_calls = 0
+
+            def __hash__(self):
+                Elem.hash_calls += 1
+                return 42
+
+        r = Record(R_A, (Elem(),))
+        h = hash(r)
+        self.assertEqual(hash(r), h)
+        self.assertEqual(hash(r), h)
+        self.assertEqual(Elem.hash_calls, 1)
+
+        class BadElem:
+            def __hash__(self):
+                1 / 0
+
+        r = Record(R_A, (BadElem(),))
+        with self.assertRaises(ZeroDivisionError):
+            hash(r)
+        with self.assertRaises(ZeroDivisionError):
+            hash(r)
+
     def test_record_contains(self):
         r = Record(R_AB, (42, 43))
         self.assertIn('a', r)
@@ -280,6 +324,23 @@ class TestRecord(tb.ConnectedTestCase):
             sorted([r1, r2, r3, r4, r5, r6, r7]),
             [r1, r2, r3, r6, r7, r4, r5])
 
+    def test_record_cmp_ints(self):
+        big = 2 ** 70
+        r1 = Record(R_AB, (big, -1))
+        r2 = Record(R_AB, (int(str(big)), -1))
+        r3 = Record(R_AB, (big + 1, -1))
+        r4 = Record(R_AB, (big, -(2 ** 70)))
+
+        self.assertEqual(r1, r2)
+        self.assertNotEqual(r1, r3)
+        self.assertNotEqual(r1, r4)
+        self.assertLess(r1, r3)
+        self.assertGreater(r1, r4)
+
+        self.assertEqual(Record(R_A, (1,)), Record(R_A, (True,)))
+        self.assertEqual(Record(R_A, (1,)), (1.0,))
+        self.assertNotEqual(Record(R_A, (2 ** 63,)), (2 ** 63 - 1,))
+
     def test_record_get(self):
         r = Record(R_AB, (42, 43))
         with self.checkref(r):
@@ -352,6 +413,7 @@ class TestRecord(tb.ConnectedTestCase):
     async def test_record_subclass_01(self):
         r = await self.con.fetchrow("SELECT 1 as a, '2' as b")
         self.assertIsInstance(r, CustomRecord)
+        self.assertFalse(hasattr(r, '__dict__'))
 
         r = await self.con.fetch("SELECT 1 as a, '2' as b")
         self.assertIsInstance(r[0], CustomRecord)
@@ -6,6 +6,7 @@
 
 
 import asyncio
+import os
 
 import asyncpg
 from asyncpg import connection as pg_connection
@@ -14,24 +15,34 @@ from asyncpg import _testbase as tb
 
 MAX_RUNTIME = 0.5
 
+# Number of timeout/query pairs in the timeout race stress test, and
+# the number of connections they are spread over.
+STRESS_ITERS = int(os.environ.get('ASYNCPG_STRESS_ITERS', 500))
+STRESS_CONCURRENCY = 8
+
+_TIMEOUT_METHODS = ('fetch', 'fetchrow', 'fetchval', 'execute')
+
 
 class TestTimeout(tb.ConnectedTestCase):
 
+    SHARED_POOL = True
+
     async def test_timeout_01(self):
-        for methname in {'fetch', 'fetchrow', 'fetchval', 'execute'}:
-            with self.assertRaises(asyncio.TimeoutError), \
+        methods = [(n, getattr(self.con, n)) for n in _TIMEOUT_METHODS]
+        for name, meth in methods:
+            with self.subTest(method=name), \
+                    self.assertRaises(asyncio.TimeoutError), \
                     self.assertRunUnder(MAX_RUNTIME):
-                meth = getattr(self.con, methname)
                 await meth('select pg_sleep(10)', timeout=0.02)
             self.assertEqual(await self.con.fetch('select 1'), [(1,)])
 
     async def test_timeout_02(self):
         st = await self.con.prepare('select pg_sleep(10)')
 
-        for methname in {'fetch', 'fetchrow', 'fetchval'}:
+        methods = [st.fetch, st.fetchrow, st.fetchval]
+        for meth in methods:
             with self.assertRaises(asyncio.TimeoutError), \
                     self.assertRunUnder(MAX_RUNTIME):
-                meth = getattr(st, methname)
                 await meth(timeout=0.02)
             self.assertEqual(await self.con.fetch('select 1'), [(1,)])
 
@@ -65,11 +76,24 @@ class TestTimeout(tb.ConnectedTestCase):
     async def test_timeout_05(self):
         # Stress-test timeouts - try to trigger a race condition
         # between a cancellation request to Postgres and next
-        # query (SELECT 1)
-        for _ in range(500):
-            with self.assertRaises(asyncio.TimeoutError):
-                await self.con.fetch('SELECT pg_sleep(1)', timeout=1e-10)
-            self.assertEqual(await self.con.fetch('SELECT 1'), [(1,)])
+        # query (SELECT 1).  The race is per connection, so every
+        # worker runs its share of the iterations on one connection.
+        pool = await self.create_pool(min_size=STRESS_CONCURRENCY,
+                                      max_size=STRESS_CONCURRENCY)
+
+        async def worker(iters):
+            async with pool.acquire() as con:
+                for _ in range(iters):
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await con.fetch('SELECT pg_sleep(1)', timeout=1e-10)
+                    self.assertEqual(await con.fetch('SELECT 1'), [(1,)])
+
+        per_worker, rest = divmod(STRESS_ITERS, STRESS_CONCURRENCY)
+        await asyncio.gather(*(
+            worker(per_worker + (i < rest))
+            for i in range(STRESS_CONCURRENCY)
+        ))
+        await pool.close()
 
     async def test_timeout_06(self):
         async with self.con.transaction():
@@ -128,10 +152,11 @@ class TestConnectionCommandTimeout(tb.ConnectedTestCase):
 
     @tb.with_connection_options(command_timeout=0.2)
     async def test_command_timeout_01(self):
-        for methname in {'fetch', 'fetchrow', 'fetchval', 'execute'}:
-            with self.assertRaises(asyncio.TimeoutError), \
+        methods = [(n, getattr(self.con, n)) for n in _TIMEOUT_METHODS]
+        for name, meth in methods:
+            with self.subTest(method=name), \
+                    self.assertRaises(asyncio.TimeoutError), \
                     self.assertRunUnder(MAX_RUNTIME):
-                meth = getattr(self.con, methname)
                 await meth('select pg_sleep(10)')
             self.assertEqual(await self.con.fetch('select 1'), [(1,)])
 
@@ -148,7 +173,7 @@ class TestTimeoutCoversPrepare(tb.ConnectedTestCase):
     @tb.with_connection_options(connection_class=SlowPrepareConnection,
                                 command_timeout=0.3)
     async def test_timeout_covers_prepare_01(self):
-        for methname in {'fetch', 'fetchrow', 'fetchval', 'execute'}:
+        methods = [getattr(self.con, n) for n in _TIMEOUT_METHODS]
+        for meth in methods:
             with self.assertRaises(asyncio.TimeoutError):
-                meth = getattr(self.con, methname)
                 await meth('select pg_sleep($1)', 0.2)
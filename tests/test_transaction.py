@@ -12,6 +12,8 @@ from asyncpg import _testbase as tb
 
 class TestTransaction(tb.ConnectedTestCase):
 
+    SHARED_POOL = True
+
     async def test_transaction_regular(self):
         self.assertIsNone(self.con._top_xact)
         self.assertFalse(self.con.is_in_transaction())
@@ -86,11 +88,7 @@ class TestTransaction(tb.ConnectedTestCase):
 
                         1 / 0
 
-                st = await self.con.prepare('SELECT * FROM mytab;')
-
-                recs = []
-                async for rec in st.cursor():
-                    recs.append(rec)
+                recs = await self.con.fetch('SELECT * FROM mytab;')
 
                 self.assertEqual(len(recs), 2)
                 self.assertEqual(recs[0][0], 1)
@@ -194,13 +192,15 @@ class TestTransaction(tb.ConnectedTestCase):
         }
         set_sql = 'SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL '
         get_sql = 'SHOW TRANSACTION ISOLATION LEVEL'
-        for tx_level in isolation_levels:
-            for conn_level in isolation_levels:
+        for conn_level in isolation_levels:
+            # The session level persists across transactions, so set it
+            # once per connection level and reset afterwards.
+            if conn_level:
+                await self.con.execute(
+                    set_sql + isolation_levels[conn_level]
+                )
+            for tx_level in isolation_levels:
                 with self.subTest(conn=conn_level, tx=tx_level):
-                    if conn_level:
-                        await self.con.execute(
-                            set_sql + isolation_levels[conn_level]
-                        )
                     level = await self.con.fetchval(get_sql)
                     self.assertEqual(level, isolation_levels[conn_level])
                     async with self.con.transaction(isolation=tx_level):
@@ -209,7 +209,7 @@ class TestTransaction(tb.ConnectedTestCase):
                             level,
                             isolation_levels[tx_level or conn_level],
                         )
-                    await self.con.reset()
+            await self.con.reset()
 
     async def test_nested_isolation_level(self):
         set_sql = 'SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL '
@@ -219,17 +219,16 @@ class TestTransaction(tb.ConnectedTestCase):
             'repeatable_read': 'repeatable read',
             'serializable': 'serializable',
         }
-        for inner in [None] + list(isolation_levels):
-            for outer, outer_sql_level in isolation_levels.items():
+        for outer, outer_sql_level in isolation_levels.items():
+            # An explicit outer level does not depend on the session
+            # level, so the session level is set once for both cases.
+            await self.con.execute(set_sql + outer_sql_level)
+            for inner in [None] + list(isolation_levels):
                 for implicit in [False, True]:
                     with self.subTest(
                         implicit=implicit, outer=outer, inner=inner,
                     ):
-                        if implicit:
-                            await self.con.execute(set_sql + outer_sql_level)
-                            outer_level = None
-                        else:
-                            outer_level = outer
+                        outer_level = None if implicit else outer
 
                         async with self.con.transaction(isolation=outer_level):
                             if inner and outer != inner:
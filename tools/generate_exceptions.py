@@ -9,9 +9,8 @@
 
 import argparse
 import builtins
-import re
 import string
-import textwrap
+import sys
 
 from asyncpg.exceptions import _base as apg_exc
 
@@ -36,6 +35,17 @@ _subclassmap = {
 }
 
 
+_acronyms = {
+    'Fdw': 'FDW',
+    'Io': 'IO',
+    'Plpgsql': 'PLPGSQL',
+    'Sql': 'SQL',
+}
+
+
+_builtin_names = frozenset(dir(builtins))
+
+
 def _get_error_name(sqlstatename, msgtype, sqlstate):
     if sqlstate in _namemap:
         return _namemap[sqlstate]
@@ -47,24 +57,49 @@ def _get_error_name(sqlstatename, msgtype, sqlstate):
     if parts[-1] != 'Error' and msgtype != 'W':
         parts.append('Error')
 
-    for i, part in enumerate(parts):
-        if part == 'Fdw':
-            parts[i] = 'FDW'
-        elif part == 'Io':
-            parts[i] = 'IO'
-        elif part == 'Plpgsql':
-            parts[i] = 'PLPGSQL'
-        elif part == 'Sql':
-            parts[i] = 'SQL'
+    errname = ''.join(_acronyms.get(part, part) for part in parts)
 
-    errname = ''.join(parts)
-
-    if hasattr(builtins, errname):
+    if errname in _builtin_names:
         errname = 'Postgres' + errname
 
     return errname
 
 
+def _render_class(clsname, base, sqlstate, docstring):
+    if sqlstate:
+        body = f"{docstring}sqlstate = '{sqlstate}'"
+    else:
+        body = docstring or 'pass'
+
+    # Move the base class to its own line if the class
+    # statement would not fit in 79 columns.
+    if len(clsname) + len(base) + len('class ():') > 79:
+        return f'class {clsname}(\n        {base}):\n    {body}'
+    else:
+        return f'class {clsname}({base}):\n    {body}'
+
+
+def _wrap_names(names, width=70):
+    # Fill lines of comma-separated quoted names up to *width*
+    # characters, the same way textwrap.wrap() would.
+    words = [f'{name!r},' for name in names]
+    if words:
+        words[-1] = words[-1][:-1]
+    lines = []
+    line = ''
+    for word in words:
+        if not line:
+            line = word
+        elif len(line) + len(word) + 1 > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f'{line} {word}'
+    if line:
+        lines.append(line)
+    return lines
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='generate _exceptions.py from postgres/errcodes.txt')
@@ -76,49 +111,34 @@ def main():
     with open(args.errcodesfile, 'r') as errcodes_f:
         errcodes = errcodes_f.read()
 
-    section_re = re.compile(r'^Section: .*')
-
-    tpl = """\
-class {clsname}({base}):
-    {docstring}{sqlstate}"""
-
     new_section = True
     section_class = None
 
-    buf = '# GENERATED FROM postgresql/src/backend/utils/errcodes.txt\n' + \
-          '# DO NOT MODIFY, use tools/generate_exceptions.py to update\n\n' + \
-          'from ._base import *  # NOQA\nfrom . import _base\n\n\n'
+    buf = [
+        '# GENERATED FROM postgresql/src/backend/utils/errcodes.txt\n'
+        '# DO NOT MODIFY, use tools/generate_exceptions.py to update\n\n'
+        'from ._base import *  # NOQA\nfrom . import _base\n\n\n'
+    ]
 
     classes = []
     clsnames = set()
 
-    def _add_class(clsname, base, sqlstate, docstring):
-        if sqlstate:
-            sqlstate = "sqlstate = '{}'".format(sqlstate)
-        else:
-            sqlstate = ''
-
-        txt = tpl.format(clsname=clsname, base=base, sqlstate=sqlstate,
-                         docstring=docstring)
-
-        if not sqlstate and not docstring:
-            txt += 'pass'
+    # Currently defined exception classes, keyed by SQLSTATE.
+    existing_classes = dict(apg_exc.PostgresMessageMeta._message_map)
 
-        if len(txt.splitlines()[0]) > 79:
-            txt = txt.replace('(', '(\n        ', 1)
-
-        classes.append(txt)
+    def _add_class(clsname, base, sqlstate, docstring):
+        classes.append((clsname, base, sqlstate, docstring))
         clsnames.add(clsname)
 
     for line in errcodes.splitlines():
         if not line.strip() or line.startswith('#'):
             continue
 
-        if section_re.match(line):
+        if line.startswith('Section: '):
             new_section = True
             continue
 
-        parts = re.split(r'\s+', line)
+        parts = line.split()
 
         if len(parts) < 4:
             continue
@@ -134,7 +154,7 @@ class {clsname}({base}):
 
         if clsname in clsnames:
             raise ValueError(
-                'duplicate exception class name: {}'.format(clsname))
+                f'duplicate exception class name: {clsname}')
 
         if new_section:
             section_class = clsname
@@ -150,12 +170,10 @@ class {clsname}({base}):
         else:
             base = section_class
 
-        existing = apg_exc.PostgresMessageMeta.get_message_class_for_sqlstate(
-            sqlstate)
+        existing = existing_classes.get(sqlstate)
 
-        if (existing and existing is not apg_exc.UnknownPostgresError and
-                existing.__doc__):
-            docstring = '"""{}"""\n\n    '.format(existing.__doc__)
+        if existing is not None and existing.__doc__:
+            docstring = f'"""{existing.__doc__}"""\n\n    '
         else:
             docstring = ''
 
@@ -166,22 +184,22 @@ class {clsname}({base}):
         for subclass in subclasses:
             existing = getattr(apg_exc, subclass, None)
             if existing and existing.__doc__:
-                docstring = '"""{}"""\n\n    '.format(existing.__doc__)
+                docstring = f'"""{existing.__doc__}"""\n\n    '
             else:
                 docstring = ''
 
             _add_class(clsname=subclass, base=clsname, sqlstate=None,
                        docstring=docstring)
 
-    buf += '\n\n\n'.join(classes)
+    buf.append('\n\n\n'.join([_render_class(*cls) for cls in classes]))
 
-    _all = textwrap.wrap(', '.join('{!r}'.format(c) for c in sorted(clsnames)))
-    buf += '\n\n\n__all__ = (\n    {}\n)'.format(
-        '\n    '.join(_all))
+    all_lines = '\n    '.join(_wrap_names(sorted(clsnames)))
+    buf.append(f'\n\n\n__all__ = (\n    {all_lines}\n)')
 
-    buf += '\n\n__all__ += _base.__all__'
+    buf.append('\n\n__all__ += _base.__all__')
 
-    print(buf)
+    buf.append('\n')
+    sys.stdout.buffer.write(''.join(buf).encode('utf-8'))
 
 
 if __name__ == '__main__':
@@ -9,6 +9,7 @@
 
 import argparse
 import asyncio
+import sys
 
 import asyncpg
 
@@ -17,6 +18,7 @@ import asyncpg
 # bootstrap to work
 #
 _BUILTIN_ARRAYS = ('_text', '_oid')
+_BUILTIN_ARRAYS_SET = frozenset(_BUILTIN_ARRAYS)
 
 _INVALIDOID = 0
 
@@ -47,20 +49,20 @@ async def runner(args):
     conn = await asyncpg.connect(host=args.pghost, port=args.pgport,
                                  user=args.pguser)
 
-    buf = (
+    buf = [
         '# Copyright (C) 2016-present the asyncpg authors and contributors\n'
         '# <see AUTHORS file>\n'
         '#\n'
         '# This module is part of asyncpg and is released under\n'
         '# the Apache 2.0 License: http://www.apache.org/licenses/LICENSE-2.0'
         '\n\n\n'
-        '# GENERATED FROM pg_catalog.pg_type\n' +
-        '# DO NOT MODIFY, use tools/generate_type_map.py to update\n\n' +
-        'DEF INVALIDOID = {}\n'.format(_INVALIDOID) +
-        'DEF MAXBUILTINOID = {}\n'.format(_MAXBUILTINOID)
-    )
+        '# GENERATED FROM pg_catalog.pg_type\n'
+        '# DO NOT MODIFY, use tools/generate_type_map.py to update\n\n',
+        f'DEF INVALIDOID = {_INVALIDOID}\n',
+        f'DEF MAXBUILTINOID = {_MAXBUILTINOID}\n',
+    ]
 
-    pg_types = await conn.fetch('''
+    rows = await conn.fetch('''
         SELECT
             oid,
             typname
@@ -73,41 +75,41 @@ async def runner(args):
         ORDER BY
             oid
     ''', _BUILTIN_ARRAYS, _MAXBUILTINOID)
+    await conn.close()
+
+    # (oid, typname) pairs; the Records are not needed past this point.
+    pg_types = [tuple(row) for row in rows]
+    del rows
 
-    defs = []
     typemap = {}
     array_types = []
 
-    for pg_type in pg_types:
-        typeoid = pg_type['oid']
-        typename = pg_type['typname']
+    buf.append(f'DEF MAXSUPPORTEDOID = {pg_types[-1][0]}\n')
 
-        defname = '{}OID'.format(typename.upper())
-        defs.append('DEF {name} = {oid}'.format(name=defname, oid=typeoid))
+    for typeoid, typename in pg_types:
+        defname = f'{typename.upper()}OID'
+        buf.append(f'\nDEF {defname} = {typeoid}')
 
-        if typename in _BUILTIN_ARRAYS:
+        if typename in _BUILTIN_ARRAYS_SET:
             array_types.append(defname)
             typename = typename[1:] + '[]'
 
         typemap[defname] = typename
 
-    buf += 'DEF MAXSUPPORTEDOID = {}\n\n'.format(pg_types[-1]['oid'])
-
-    buf += '\n'.join(defs)
-
-    buf += '\n\ncdef ARRAY_TYPES = ({},)'.format(', '.join(array_types))
+    buf.append(f"\n\ncdef ARRAY_TYPES = ({', '.join(array_types)},)")
 
-    f_typemap = ('{}: {!r}'.format(dn, n) for dn, n in sorted(typemap.items()))
-    buf += '\n\nBUILTIN_TYPE_OID_MAP = {{\n    {}\n}}'.format(
-        ',\n    '.join(f_typemap))
-    buf += ('\n\nBUILTIN_TYPE_NAME_MAP = ' +
-            '{v: k for k, v in BUILTIN_TYPE_OID_MAP.items()}')
+    f_typemap = [f'{dn}: {n!r}' for dn, n in sorted(typemap.items())]
+    typemap_lines = ',\n    '.join(f_typemap)
+    buf.append(f'\n\nBUILTIN_TYPE_OID_MAP = {{\n    {typemap_lines}\n}}')
+    buf.append('\n\nBUILTIN_TYPE_NAME_MAP = '
+               '{v: k for k, v in BUILTIN_TYPE_OID_MAP.items()}')
 
     for k, v in _TYPE_ALIASES.items():
-        buf += ('\n\nBUILTIN_TYPE_NAME_MAP[{!r}] = \\\n    '
-                'BUILTIN_TYPE_NAME_MAP[{!r}]'.format(k, v))
+        buf.append(f'\n\nBUILTIN_TYPE_NAME_MAP[{k!r}] = \\\n    '
+                   f'BUILTIN_TYPE_NAME_MAP[{v!r}]')
 
-    print(buf)
+    buf.append('\n')
+    sys.stdout.buffer.write(''.join(buf).encode('utf-8'))
 
 
 def main():